@@ -1,19 +1,216 @@
+import collections
+import dataclasses
 import ffmpeg
+import functools
 import subprocess  # For more reliable video concatenation
 import os
 import shutil  # To check if ffmpeg is installed
+import threading
+import time
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg_installed():
-    """Check if FFmpeg is installed on the system"""
+    """
+    Check if FFmpeg is installed on the system.
+
+    shutil.which walks the whole PATH (one stat per directory), so the
+    successful result is cached — every overlay/concat call after the first
+    skips the PATH scan. A failed check is not cached, so installing FFmpeg
+    mid-session is picked up.
+    """
     if shutil.which("ffmpeg") is None:
         raise EnvironmentError("FFmpeg not found. Please install FFmpeg and ensure it's in your system's PATH.")
 
+# Cached result of the hardware encoder probe (None = not probed yet)
+_hw_encoder = None
+
+def _detect_hw_encoder() -> str:
+    """
+    Detect the best available H.264 encoder with a one-frame smoke test.
+
+    `ffmpeg -encoders` only lists encoders compiled into the build — stock
+    distro builds list h264_nvenc even on machines without an NVIDIA GPU —
+    so each listed candidate is verified by actually encoding a single
+    null-source frame and checking the exit code. Hardware encoders are
+    preferred in order: NVENC (NVIDIA), QSV (Intel), VAAPI (generic Linux),
+    AMF (AMD). Falls back to software libx264 when none initializes. The
+    probe result is cached for the process lifetime, so repeated calls are
+    free.
+
+    Returns:
+        str: Encoder name usable as the `vcodec` option (e.g., 'h264_nvenc').
+    """
+    global _hw_encoder
+    if _hw_encoder is not None:
+        return _hw_encoder
+
+    _hw_encoder = 'libx264'  # Safe default if every probe fails
+    try:
+        listed = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True, check=False
+        )
+        if listed.returncode == 0:
+            for candidate in ('h264_nvenc', 'h264_qsv', 'h264_vaapi', 'h264_amf'):
+                if candidate not in listed.stdout:
+                    continue
+                # Compiled in; now prove it can initialize on this hardware
+                smoke = subprocess.run(
+                    ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                     '-f', 'lavfi', '-i', 'nullsrc=s=256x256:r=25:d=0.1',
+                     '-frames:v', '1', '-c:v', candidate, '-f', 'null', '-'],
+                    capture_output=True, check=False
+                )
+                if smoke.returncode == 0:
+                    _hw_encoder = candidate
+                    break
+    except OSError:
+        pass  # ffmpeg missing/broken; check_ffmpeg_installed() reports that separately
+
+    print(f"Using H.264 encoder: {_hw_encoder}")
+    return _hw_encoder
+
+def _has_audio_stream(video_path: str) -> bool:
+    """
+    Check whether a media file contains an audio stream.
+
+    Prefers PyAV, which reads the container header in-process, over
+    ffmpeg.probe, which forks a full ffprobe subprocess (~100-300 ms of
+    fixed cost per call). Falls back to ffprobe when PyAV isn't installed.
+    """
+    try:
+        import av
+    except ImportError:
+        probe = ffmpeg.probe(video_path)
+        return any(stream["codec_type"] == "audio" for stream in probe["streams"])
+    with av.open(video_path) as container:
+        return any(stream.type == 'audio' for stream in container.streams)
+
+def _media_duration(media_path: str) -> float:
+    """
+    Container duration in seconds.
+
+    Same strategy as _has_audio_stream: PyAV reads the header in-process,
+    with an ffprobe fallback when PyAV isn't installed.
+    """
+    try:
+        import av
+    except ImportError:
+        probe = ffmpeg.probe(media_path)
+        return float(probe['format']['duration'])
+    with av.open(media_path) as container:
+        return container.duration / 1_000_000  # AV_TIME_BASE (microsecond) units
+
+def _thread_args() -> list:
+    """
+    Filter-thread arguments tuned to the host CPU.
+
+    Only genuinely global options belong here: -threads is a per-file codec
+    option and would be dropped if appended after the output filename (as
+    ffmpeg-python does with global args), so codec threads are set via the
+    `threads` output option in _encoder_opts instead. The filter graphs get
+    half the core count.
+    """
+    ncpu = os.cpu_count() or 1
+    return [
+        '-filter_threads', str(max(1, ncpu // 2)),
+        '-filter_complex_threads', str(max(1, ncpu // 2)),
+    ]
+
+def _run_with_progress(stream, description: str = 'Processing'):
+    """
+    Run an ffmpeg graph with machine-readable progress reporting.
+
+    The default stderr stats line is rewritten for every frame, which is
+    measurably slow on long encodes. This adds -nostats/-loglevel error and
+    -progress pipe:1 so ffmpeg emits cheap key=value records instead; a
+    background thread drains them and prints at most one status line per
+    second. Raises ffmpeg.Error on a non-zero exit, matching ffmpeg.run.
+    """
+    stream = stream.global_args('-nostats', '-loglevel', 'error', '-progress', 'pipe:1')
+    process = ffmpeg.run_async(stream, pipe_stdout=True, pipe_stderr=True, overwrite_output=True)
+
+    def _drain_progress(pipe):
+        last_print = 0.0
+        for raw_line in pipe:
+            line = raw_line.decode('utf-8', 'replace').strip()
+            if line.startswith('out_time=') and time.monotonic() - last_print >= 1.0:
+                print(f"{description}... {line}")
+                last_print = time.monotonic()
+
+    drain_thread = threading.Thread(target=_drain_progress, args=(process.stdout,), daemon=True)
+    drain_thread.start()
+    stderr_output = process.stderr.read()  # -loglevel error: only real errors land here
+    returncode = process.wait()
+    drain_thread.join()
+    if returncode != 0:
+        raise ffmpeg.Error('ffmpeg', None, stderr_output)
+
+def _encoder_opts(encoder: str, x264_preset: str = 'ultrafast', x264_tune: str = 'zerolatency') -> dict:
+    """Return per-encoder quality/preset output options."""
+    # Codec threads pinned to the core count: ffmpeg's default of
+    # min(16, ~1.5x cores) oversubscribes high-core machines and loses
+    # throughput to context switching. This is a per-file option, so it has
+    # to ride on the output rather than in _thread_args' global flags
+    opts = {'threads': os.cpu_count() or 1}
+    if encoder == 'h264_nvenc':
+        # NVENC ignores qscale:v; use its own rate control (VBR with a
+        # constant-quality target) and a low-latency medium preset instead
+        opts.update({'preset': 'p4', 'tune': 'll', 'rc': 'vbr', 'cq': 23})
+    elif encoder == 'libx264':
+        # On the CPU fallback, favor throughput: ultrafast/zerolatency is
+        # several times faster than x264's default medium preset
+        opts.update({'preset': x264_preset, 'tune': x264_tune, 'crf': 23})
+    return opts
+
+def _build_overlay_graph(input_video_path: str, image_path: str, encoder: str, x: str, y: str):
+    """
+    Build the decode + image-overlay part of an ffmpeg graph.
+
+    Under NVENC, decode with CUVID into CUDA surfaces, upload the overlay
+    image once via hwupload_cuda, and composite with overlay_cuda so frames
+    stay in VRAM end to end. Other encoders get the plain CPU overlay path.
+
+    Returns:
+        tuple: (in_video input node, overlaid video stream).
+    """
+    if encoder == 'h264_nvenc':
+        # Full-GPU pipeline: decode with CUVID into CUDA surfaces, overlay
+        # on the GPU, and hand frames straight to NVENC. This keeps every
+        # frame in VRAM and avoids two PCIe copies (device->host->device).
+        in_video = ffmpeg.input(
+            input_video_path,
+            hwaccel='cuda',
+            hwaccel_output_format='cuda',
+            vcodec='h264_cuvid'
+        )
+        in_image = ffmpeg.input(image_path)
+        # The image is decoded on the CPU, so upload it to a CUDA surface
+        # once; overlay_cuda then composites entirely on-device
+        image_gpu = in_image['v'].filter('hwupload_cuda')
+        processed_video = ffmpeg.filter(
+            [in_video['v'], image_gpu], 'overlay_cuda', x=x, y=y
+        )
+    else:
+        # CPU path: plain software decode + overlay filter
+        in_video = ffmpeg.input(input_video_path)
+        in_image = ffmpeg.input(image_path)
+
+        # Use overlay filter, ensuring original audio stream is preserved
+        # [0:v] represents the video stream of the first input (video)
+        # [1:v] represents the video stream of the second input (image) (image treated as single-frame video)
+        # [0:a?] represents the audio stream of the first input (video) (if it exists '?')
+        processed_video = ffmpeg.overlay(in_video['v'], in_image['v'], x=x, y=y)
+    return in_video, processed_video
+
 def overlay_image(
     input_video_path: str,
     image_path: str,
     output_video_path: str,
     x: str = '10',  # Default x coordinate (top-left)
-    y: str = '10'   # Default y coordinate (top-left)
+    y: str = '10',  # Default y coordinate (top-left)
+    x264_preset: str = 'ultrafast',   # x264 speed preset (software fallback only)
+    x264_tune: str = 'zerolatency'    # x264 tuning (software fallback only)
 ):
     """
     Overlay an image on a video.
@@ -24,31 +221,32 @@ def overlay_image(
         output_video_path (str): Output video file path.
         x (str): X coordinate for image overlay (FFmpeg syntax, e.g., '10', 'main_w-overlay_w-10').
         y (str): Y coordinate for image overlay (FFmpeg syntax, e.g., '10', 'main_h-overlay_h-10').
+        x264_preset (str): x264 preset when falling back to software encoding.
+        x264_tune (str): x264 tune when falling back to software encoding.
     """
     check_ffmpeg_installed()
     print(f"Overlaying image '{image_path}' onto '{input_video_path}'...")
     try:
-        in_video = ffmpeg.input(input_video_path)
-        in_image = ffmpeg.input(image_path)
-
-        # Use overlay filter, ensuring original audio stream is preserved
-        # [0:v] represents the video stream of the first input (video)
-        # [1:v] represents the video stream of the second input (image) (image treated as single-frame video)
-        # [0:a?] represents the audio stream of the first input (video) (if it exists '?')
-        processed_video = ffmpeg.overlay(in_video['v'], in_image['v'], x=x, y=y)
+        # Pick the best available encoder (hardware if present, libx264 otherwise)
+        encoder = _detect_hw_encoder()
+        in_video, processed_video = _build_overlay_graph(input_video_path, image_path, encoder, x, y)
 
         # Output by combining processed video stream and original audio stream
         stream = ffmpeg.output(
             processed_video,             # Processed video stream
             in_video['a?'],              # Original audio stream (if exists)
-            output_video_path,
-            vcodec='libx264',            # Choose suitable video codec
+            os.fspath(output_video_path),  # ffmpeg-python requires a str filename
+            vcodec=encoder,              # Detected hardware or software codec
             acodec='aac',                # Choose suitable audio codec
             strict='experimental',       # Sometimes needed
-            **{'qscale:v': '3'}          # Control video quality (optional, lower value = better quality)
+            movflags='+faststart',       # Move moov atom to front for streaming playback
+            **_encoder_opts(encoder, x264_preset, x264_tune)  # Encoder-specific quality/preset options
         )
-        # Run ffmpeg command, overwrite existing output file
-        ffmpeg.run(stream, overwrite_output=True, quiet=False)  # quiet=False to show FFmpeg output
+        # Run the whole graph as one filter_complex invocation with threaded
+        # filter execution, so overlay + encode share a single frame pipeline
+        stream = stream.global_args(*_thread_args())
+        # Run ffmpeg command with throttled progress, overwrite existing output file
+        _run_with_progress(stream, 'Overlaying image')
         print(f"Image overlay complete. Output: '{output_video_path}'")
     except ffmpeg.Error as e:
         print("FFmpeg Error during image overlay:")
@@ -77,43 +275,49 @@ def overlay_audio(
     print(f"Overlaying audio '{input_audio_path}' onto '{input_video_path}'...")
     try:
         # First, check if the video has an audio stream
-        probe = ffmpeg.probe(input_video_path)
-        has_audio = any(stream["codec_type"] == "audio" for stream in probe["streams"])
+        has_audio = _has_audio_stream(input_video_path)
         
         in_video = ffmpeg.input(input_video_path)
         in_audio = ffmpeg.input(input_audio_path)
-        
-        # Adjust the audio overlay volume
-        overlay_audio = in_audio['a'].filter('volume', volume=volume_overlay)
-        
+
         # Different handling depending on whether input video has audio
         if has_audio:
             print("Input video has audio stream. Mixing with overlay audio...")
-            # Prepare video's audio with adjusted volume
-            video_audio = in_video['a'].filter('volume', volume=volume_video)
-            
-            # Mix the two audio streams
-            mixed_audio = ffmpeg.filter([video_audio, overlay_audio], 
-                                      'amix', 
-                                      inputs=2, 
-                                      duration='first', 
-                                      dropout_transition=1)
+            # Fold both per-stream gains into amix's weights so mixing is a
+            # single DSP pass (no separate volume filters per input)
+            mixed_audio = ffmpeg.filter([in_video['a'], in_audio['a']],
+                                      'amix',
+                                      inputs=2,
+                                      duration='first',
+                                      dropout_transition=1,
+                                      weights=f'{volume_video} {volume_overlay}')
+            audio_codec = 'aac'
+        elif volume_overlay == 1.0:
+            print("Input video has no audio stream and volume is unchanged. Stream-copying overlay audio...")
+            # No mixing and no gain change: skip the filter graph entirely and
+            # mux the overlay audio in as-is (no decode/resample/encode pass)
+            mixed_audio = in_audio['a']
+            audio_codec = 'copy'
         else:
             print("Input video has no audio stream. Using overlay audio directly...")
-            # If no audio in video, use the overlay audio directly
-            mixed_audio = overlay_audio
+            # Only a gain change is needed on the overlay audio
+            mixed_audio = in_audio['a'].filter('volume', volume=volume_overlay)
+            audio_codec = 'aac'
 
         # Output using original video stream and processed audio stream
         stream = ffmpeg.output(
             in_video['v'],       # Video stream
-            mixed_audio,         # Audio stream (either mixed or direct overlay)
-            output_video_path,
+            mixed_audio,         # Audio stream (mixed, gained, or stream-copied)
+            os.fspath(output_video_path),  # ffmpeg-python requires a str filename
             vcodec='copy',       # Copy video stream to avoid re-encoding
-            acodec='aac',        # Audio codec
+            acodec=audio_codec,  # 'copy' when no filtering was needed
             strict='experimental',
             shortest=None        # Ensure output duration matches video
         )
-        ffmpeg.run(stream, overwrite_output=True, quiet=False)
+        if audio_codec != 'copy':
+            # Threaded filter execution for the audio graph
+            stream = stream.global_args(*_thread_args())
+        _run_with_progress(stream, 'Overlaying audio')
         print(f"Audio overlay complete. Output: '{output_video_path}'")
     except ffmpeg.Error as e:
         print("FFmpeg Error during audio overlay:")
@@ -125,6 +329,193 @@ def overlay_audio(
             print(f"An unexpected ffmpeg error occurred: {e}")
         raise
 
+def overlay_image_and_audio(
+    input_video_path: str,
+    image_path: str,
+    input_audio_path: str,
+    output_video_path: str,
+    x: str = '10',               # Image x coordinate (FFmpeg syntax)
+    y: str = '10',               # Image y coordinate (FFmpeg syntax)
+    volume_video: float = 1.0,   # Original video volume
+    volume_overlay: float = 0.7, # Overlay audio volume
+    concat_video_paths: list = None  # Optional follow-on videos to append
+):
+    """
+    Overlay an image AND mix in an audio track in a single FFmpeg pass.
+
+    Fusing both operations into one graph encodes the video exactly once,
+    instead of overlay_image + overlay_audio writing (and re-reading) a
+    fully-encoded intermediate MP4 between them. Optionally, follow-on
+    videos are appended with the concat filter in the same pass, so no
+    intermediate MP4 is ever written; unlike the concat demuxer, the
+    concat filter does not require the inputs to share codec parameters.
+
+    Args:
+        input_video_path (str): Input video file path.
+        image_path (str): Path to the image file to overlay.
+        input_audio_path (str): Path to the audio file to mix in.
+        output_video_path (str): Output video file path.
+        x (str): X coordinate for image overlay (FFmpeg syntax).
+        y (str): Y coordinate for image overlay (FFmpeg syntax).
+        volume_video (float): Volume factor for the original video audio track.
+        volume_overlay (float): Volume factor for the overlay audio track.
+        concat_video_paths (list, optional): Paths of videos to append (in
+            order) after the overlaid segment, all within this same pass.
+    """
+    check_ffmpeg_installed()
+    print(f"Overlaying image '{image_path}' and audio '{input_audio_path}' onto '{input_video_path}'...")
+    try:
+        # Check if the video has its own audio stream to mix with
+        has_audio = _has_audio_stream(input_video_path)
+
+        encoder = _detect_hw_encoder()
+        in_video, processed_video = _build_overlay_graph(input_video_path, image_path, encoder, x, y)
+        in_audio = ffmpeg.input(input_audio_path)
+
+        if has_audio:
+            print("Input video has audio stream. Mixing with overlay audio...")
+            # Fold both per-stream gains into amix's weights (single DSP pass)
+            mixed_audio = ffmpeg.filter([in_video['a'], in_audio['a']],
+                                      'amix',
+                                      inputs=2,
+                                      duration='first',
+                                      dropout_transition=1,
+                                      weights=f'{volume_video} {volume_overlay}')
+        elif volume_overlay == 1.0:
+            print("Input video has no audio stream and volume is unchanged. Using overlay audio as-is...")
+            mixed_audio = in_audio['a']
+        else:
+            print("Input video has no audio stream. Using overlay audio directly...")
+            mixed_audio = in_audio['a'].filter('volume', volume=volume_overlay)
+
+        out_video, out_audio = processed_video, mixed_audio
+        if concat_video_paths:
+            if not has_audio:
+                # Without a video audio track nothing bounds the overlay
+                # audio, and an over-long first leg would push every appended
+                # segment out of sync; trim it to the first video's duration
+                mixed_audio = mixed_audio.filter(
+                    'atrim', duration=_media_duration(input_video_path)
+                )
+            # Append follow-on segments with the concat filter in this same
+            # graph, interleaving (video, audio) pairs per segment. The
+            # concat filter needs every audio leg to share sample rate and
+            # channel layout, so each one is normalized via aformat
+            segments = [
+                processed_video,
+                mixed_audio.filter('aformat', sample_rates='44100', channel_layouts='stereo')
+            ]
+            for follow_on_path in concat_video_paths:
+                if encoder == 'h264_nvenc':
+                    # Decode follow-ons on the GPU too so all concat inputs
+                    # live in the same (CUDA) frame context
+                    follow_on = ffmpeg.input(
+                        follow_on_path,
+                        hwaccel='cuda',
+                        hwaccel_output_format='cuda',
+                        vcodec='h264_cuvid'
+                    )
+                else:
+                    follow_on = ffmpeg.input(follow_on_path)
+                if _has_audio_stream(follow_on_path):
+                    follow_on_audio = follow_on['a'].filter(
+                        'aformat', sample_rates='44100', channel_layouts='stereo'
+                    )
+                else:
+                    # Follow-on has no audio track: substitute a silent leg of
+                    # the same duration so concat still gets a (video, audio)
+                    # pair for every segment
+                    silence = ffmpeg.input(
+                        'anullsrc=channel_layout=stereo:sample_rate=44100',
+                        f='lavfi',
+                        t=_media_duration(follow_on_path)
+                    )
+                    follow_on_audio = silence['a']
+                segments.extend([follow_on['v'], follow_on_audio])
+            joined = ffmpeg.concat(*segments, v=1, a=1).node
+            out_video, out_audio = joined[0], joined[1]
+            print(f"Appending {len(concat_video_paths)} follow-on video(s) in the same pass...")
+
+        stream = ffmpeg.output(
+            out_video,                   # Overlaid (and concatenated) video stream
+            out_audio,                   # Mixed (and concatenated) audio stream
+            os.fspath(output_video_path),  # ffmpeg-python requires a str filename
+            vcodec=encoder,              # Detected hardware or software codec
+            acodec='aac',                # Audio codec
+            strict='experimental',
+            shortest=None,               # Ensure output duration matches video
+            movflags='+faststart',       # Move moov atom to front for streaming playback
+            **_encoder_opts(encoder)     # Encoder-specific quality/preset options
+        )
+        stream = stream.global_args(*_thread_args())
+        _run_with_progress(stream, 'Overlaying image and audio')
+        print(f"Image and audio overlay complete. Output: '{output_video_path}'")
+    except ffmpeg.Error as e:
+        print("FFmpeg Error during image/audio overlay:")
+        stderr_output = getattr(e, 'stderr', None)
+        if stderr_output:
+            print(stderr_output.decode())
+        else:
+            print(f"An unexpected ffmpeg error occurred: {e}")
+        raise
+
+@dataclasses.dataclass
+class OverlayJob:
+    """One image-overlay task for process_batch."""
+    input_video_path: str
+    image_path: str
+    output_video_path: str
+    x: str = '10'  # Image x coordinate (FFmpeg syntax)
+    y: str = '10'  # Image y coordinate (FFmpeg syntax)
+
+def process_batch(jobs: list[OverlayJob]):
+    """
+    Run multiple image-overlay jobs through ONE ffmpeg process.
+
+    Each ffmpeg launch pays process startup, codec initialization and (with
+    NVENC) CUDA context creation. Batching N jobs into a single invocation
+    with N inputs and N mapped outputs amortizes those fixed costs across
+    the batch, which dominates throughput for many short clips.
+
+    Args:
+        jobs (list[OverlayJob]): Overlay tasks to run, one output file each.
+    """
+    check_ffmpeg_installed()
+    if not jobs:
+        print("No jobs to process.")
+        return
+
+    print(f"Processing batch of {len(jobs)} overlay job(s) in one ffmpeg invocation...")
+    try:
+        encoder = _detect_hw_encoder()
+        outputs = []
+        for job in jobs:
+            in_video, processed_video = _build_overlay_graph(
+                job.input_video_path, job.image_path, encoder, job.x, job.y
+            )
+            outputs.append(ffmpeg.output(
+                processed_video,
+                in_video['a?'],              # Original audio stream (if exists)
+                os.fspath(job.output_video_path),  # ffmpeg-python requires a str filename
+                vcodec=encoder,
+                acodec='aac',
+                strict='experimental',
+                movflags='+faststart',
+                **_encoder_opts(encoder)
+            ))
+        stream = ffmpeg.merge_outputs(*outputs)
+        stream = stream.global_args(*_thread_args())
+        _run_with_progress(stream, 'Processing batch')
+        print(f"Batch complete. {len(jobs)} output file(s) written.")
+    except ffmpeg.Error as e:
+        print("FFmpeg Error during batch processing:")
+        stderr_output = getattr(e, 'stderr', None)
+        if stderr_output:
+            print(stderr_output.decode())
+        else:
+            print(f"An unexpected ffmpeg error occurred: {e}")
+        raise
+
 def concatenate_videos(video_paths: list, output_video_path: str):
     """
     Use FFmpeg concat demuxer to concatenate multiple video files.
@@ -142,51 +533,70 @@ def concatenate_videos(video_paths: list, output_video_path: str):
 
     print(f"Concatenating videos: {video_paths}...")
 
-    # 1. Create temporary file list mylist.txt
-    list_file_path = "mylist.txt"  # Place in project root, delete at end
     try:
-        with open(list_file_path, 'w', encoding='utf-8') as f:
-            for path in video_paths:
-                # Handle Windows path backslashes and special characters, ensuring FFmpeg parses correctly
-                # Use repr() to add quotes and escape special characters, then remove outer single quotes
-                safe_path = repr(os.path.abspath(path))[1:-1]
-                f.write(f"file '{safe_path}'\n")
-        print(f"Generated temporary list file: {list_file_path}")
+        # 1. Build the concat list in memory; it is fed to ffmpeg over stdin,
+        # so no temporary file is written and concurrent calls can't race.
+        # getcwd is hoisted out of the loop: os.path.abspath would re-fetch
+        # it (one syscall) for every entry, which adds up on large batches
+        cwd = os.getcwd()
+        lines = []
+        for path in video_paths:
+            abs_path = os.fspath(path)
+            if not os.path.isabs(abs_path):
+                abs_path = os.path.join(cwd, abs_path)
+            # concat demuxer quoting rules: use forward slashes and escape
+            # embedded single quotes as '\'' (repr()-based escaping breaks
+            # on paths that themselves contain a single quote). The explicit
+            # file: protocol prefix is required: entries are resolved relative
+            # to the list's own protocol, so with the list on pipe:0 a bare
+            # path would be opened as pipe:/... and fail
+            safe_path = os.path.normpath(abs_path).replace("\\", "/").replace("'", "'\\''")
+            lines.append(f"file 'file:{safe_path}'\n")
+        list_text = ''.join(lines)
 
         # 2. Build FFmpeg command
         # -f concat: Use concat demuxer
         # -safe 0: Allow absolute paths or paths with special characters (works with safe_path above)
-        # -i mylist.txt: Specify input file list
+        # -protocol_whitelist pipe,file: Allow reading the list from stdin and the entries from disk
+        # -i pipe:0: Read the input file list from stdin
         # -c copy: Direct stream copy, no re-encoding (fast, but requires consistent format)
         command = [
             'ffmpeg',
             '-f', 'concat',
             '-safe', '0',
-            '-i', list_file_path,
+            '-protocol_whitelist', 'pipe,file',
+            '-i', 'pipe:0',
             '-c', 'copy',  # If video formats not completely identical, may need to remove '-c copy' for re-encoding
             output_video_path
         ]
 
         print(f"Executing FFmpeg command: {' '.join(command)}")
 
-        # 3. Execute FFmpeg command
-        process = subprocess.run(command, capture_output=True, text=True, check=False)  # check=False for manual checking
+        # 3. Execute FFmpeg command, passing the concat list via stdin.
+        # stderr is streamed and only the last 200 lines are retained, so a
+        # long concatenation's per-frame progress chatter doesn't pile up in
+        # memory the way capture_output would buffer it
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        process.stdin.write(list_text)
+        process.stdin.close()
+        stderr_tail = collections.deque(process.stderr, maxlen=200)
+        returncode = process.wait()
 
         # 4. Check results
-        if process.returncode != 0:
+        if returncode != 0:
             print("FFmpeg Error during concatenation:")
-            print("STDOUT:", process.stdout)
-            print("STDERR:", process.stderr)
-            raise RuntimeError(f"FFmpeg concatenation failed with return code {process.returncode}")
+            print("STDERR (last 200 lines):", ''.join(stderr_tail))
+            raise RuntimeError(f"FFmpeg concatenation failed with return code {returncode}")
         else:
             print(f"Video concatenation complete. Output: '{output_video_path}'")
             # print("FFmpeg Output:", process.stdout)  # Optional: Print output on success
 
     except Exception as e:
         print(f"An error occurred during concatenation: {e}")
-        raise
-    finally:
-        # 5. Delete temporary file
-        if os.path.exists(list_file_path):
-            os.remove(list_file_path)
-            print(f"Removed temporary list file: {list_file_path}")
\ No newline at end of file
+        raise
\ No newline at end of file
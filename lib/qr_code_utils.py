@@ -1,39 +1,58 @@
-import pyqrcode
-import png  # needs pypng library
-from PIL import Image
+import functools
+import io
 import os
 
-def generate_qr_code_with_logo(url: str, output_path: str, logo_path: str = None, scale: int = 8, border: int = 4):
+import numpy as np
+import segno
+from PIL import Image
+
+@functools.lru_cache(maxsize=8)
+def _load_resized_logo(logo_path: str, max_logo_size: int) -> Image.Image:
+    """
+    Load a logo and scale it down to fit within max_logo_size (proportional).
+
+    Cached so repeated QR generations with the same logo skip the decode and
+    resize entirely — the pooled-buffer equivalent for this workload.
+    """
+    logo = Image.open(logo_path).convert("RGBA")
+    logo.thumbnail((max_logo_size, max_logo_size))  # Proportional scaling
+    return logo
+
+def generate_qr_code_with_logo(url: str, output_path: str, logo_path: str = None, scale: int = 8, border: int = 4, target_size: int = None):
     """
     Generate a QR code with a centered logo.
 
     Args:
         url (str): URL to encode in the QR code.
-        output_path (str): Complete path for the output PNG image.
+        output_path (str): Complete path for the output image. The format is
+            inferred from the extension; .bmp skips the zlib decode that PNG
+            costs every consumer (e.g., ffmpeg loading the overlay).
         logo_path (str, optional): Path to the logo image. If None, generates QR code without a logo.
         scale (int, optional): Size of QR code modules (pixels). Default is 8.
         border (int, optional): Width of QR code border (modules). Default is 4.
+        target_size (int, optional): Final on-screen size in pixels (width and height).
+            If set, the finished image is resized once here so downstream video
+            filters never have to scale it per frame.
 
     Raises:
         FileNotFoundError: If the specified logo file doesn't exist.
         ValueError: If the logo is too large to embed.
     """
     print(f"Generating QR code for URL: {url}")
-    qr_code = pyqrcode.create(url, error='H')  # Use high error correction level 'H'
-
-    # Save QR code as temporary file for Pillow processing
-    temp_qr_path = output_path + ".tmp.png"
-    qr_code.png(temp_qr_path, scale=scale, module_color=[0, 0, 0, 255], background=[255, 255, 255, 255], quiet_zone=border)
+    qr_code = segno.make(url, error='h')  # Use high error correction level 'H'
 
-    qr_img = Image.open(temp_qr_path).convert("RGBA")
+    # Render the QR code into an in-memory buffer for Pillow processing
+    # (no temporary file on disk, no PNG write+read round-trip)
+    bio = io.BytesIO()
+    qr_code.save(bio, kind='png', scale=scale, border=border, dark='black', light='white')
+    bio.seek(0)
+    qr_img = Image.open(bio).convert("RGBA")
 
     if logo_path:
         if not os.path.exists(logo_path):
-            os.remove(temp_qr_path)  # Clean up temporary file
             raise FileNotFoundError(f"Logo file not found: {logo_path}")
 
         print(f"Embedding logo: {logo_path}")
-        logo = Image.open(logo_path).convert("RGBA")
 
         # --- Logo size adjustment ---
         # Logo size should not exceed about 20% of the QR code total area for readability
@@ -41,11 +60,10 @@ def generate_qr_code_with_logo(url: str, output_path: str, logo_path: str = None
         qr_width, qr_height = qr_img.size
         max_logo_size = int(min(qr_width, qr_height) * 0.20)  # Limit max logo size
 
-        logo.thumbnail((max_logo_size, max_logo_size))  # Proportional scaling
+        logo = _load_resized_logo(logo_path, max_logo_size)  # Cached decode + resize
 
         logo_width, logo_height = logo.size
         if logo_width == 0 or logo_height == 0:
-             os.remove(temp_qr_path)
              raise ValueError("Logo size is invalid after resizing.")
 
         # --- Calculate logo paste position (centered) ---
@@ -53,19 +71,28 @@ def generate_qr_code_with_logo(url: str, output_path: str, logo_path: str = None
         box_y = (qr_height - logo_height) // 2
         box = (box_x, box_y, box_x + logo_width, box_y + logo_height)
 
-        # --- Create white background layer to prevent logo's transparent parts from showing QR code ---
-        # Note: A more advanced method would be to only clear QR code pixels in the logo area, but we're simplifying with a white background
-        background = Image.new('RGBA', (logo_width, logo_height), (255, 255, 255, 255))
-        qr_img.paste(background, (box_x, box_y))
+        # --- Composite logo over a white backing in one vectorized pass ---
+        # The white backing stops the logo's transparent parts from showing the
+        # QR modules underneath; folding it into the alpha blend replaces two
+        # per-pixel PIL passes (rectangle fill + masked paste) with a single
+        # numpy expression over the logo-sized region
+        logo_arr = np.asarray(logo, dtype=np.float32)
+        alpha = logo_arr[..., 3:4] / 255.0
+        blended = logo_arr[..., :3] * alpha + 255.0 * (1.0 - alpha)
 
-        # --- Paste logo ---
-        # Use logo's alpha channel as a mask for pasting
-        qr_img.paste(logo, box, mask=logo)
+        qr_arr = np.array(qr_img)  # Writable copy of the QR pixels
+        qr_arr[box_y:box_y + logo_height, box_x:box_x + logo_width, :3] = blended.astype(np.uint8)
+        qr_arr[box_y:box_y + logo_height, box_x:box_x + logo_width, 3] = 255  # Fully opaque
+        qr_img = Image.fromarray(qr_arr)
         print(f"Logo embedded at position: {box}")
 
-    # Save final image
-    qr_img.save(output_path)
-    print(f"QR code with logo saved to: {output_path}")
+    # Resize once to the final on-screen size (NEAREST keeps module edges sharp)
+    if target_size:
+        qr_img = qr_img.resize((target_size, target_size), Image.NEAREST)
+        print(f"QR code pre-scaled to {target_size}x{target_size} pixels")
 
-    # Clean up temporary file
-    os.remove(temp_qr_path)
\ No newline at end of file
+    # Save final image (BMP can't carry alpha, and the QR is fully opaque anyway)
+    if os.fspath(output_path).lower().endswith('.bmp'):
+        qr_img = qr_img.convert('RGB')
+    qr_img.save(output_path)
+    print(f"QR code with logo saved to: {output_path}")
\ No newline at end of file
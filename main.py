@@ -1,11 +1,12 @@
 import os
 import sys
+from pathlib import Path
 from lib import ffmpeg_utils
 from lib import qr_code_utils
 
 # --- Configuration Parameters ---
-INPUT_DIR = "input"
-OUTPUT_DIR = "output"
+INPUT_DIR = Path("input")
+OUTPUT_DIR = Path("output")
 URL_TO_ENCODE = "https://google.com"
 LOGO_FILENAME = "img.jpg"  # Logo filename, placed in INPUT_DIR
 
@@ -14,12 +15,13 @@ VIDEO1_FILENAME = "ch1.mp4"
 VIDEO2_FILENAME = "ch2.mp4"
 AUDIO_OVERLAY_FILENAME = "target.m4a"
 
-# Output and intermediate filenames
-QR_CODE_FILENAME = "qr_code_with_logo.png"
-INTERMEDIATE_VIDEO1 = "intermediate_1_qr.mp4"
-INTERMEDIATE_VIDEO2 = "intermediate_2_audio.mp4"
+# Output filenames
+QR_CODE_FILENAME = "qr_code_with_logo.bmp"  # BMP: ffmpeg loads the overlay without a zlib/PNG decode
 FINAL_OUTPUT_FILENAME = "final_output.mp4"
 
+# Final on-screen QR code size in pixels (pre-scaled once, not per video frame)
+QR_TARGET_SIZE = 200
+
 # Image overlay position (FFmpeg syntax)
 OVERLAY_X = 'main_w-overlay_w-10'  # 10px from right edge
 OVERLAY_Y = '10'                   # 10px from top edge
@@ -34,26 +36,30 @@ def main():
         sys.exit(1)  # Exit program
 
     # 2. Ensure input files exist
-    video1_path = os.path.join(INPUT_DIR, VIDEO1_FILENAME)
-    video2_path = os.path.join(INPUT_DIR, VIDEO2_FILENAME)
-    audio_path = os.path.join(INPUT_DIR, AUDIO_OVERLAY_FILENAME)
-    logo_path = os.path.join(INPUT_DIR, LOGO_FILENAME)
+    video1_path = INPUT_DIR / VIDEO1_FILENAME
+    video2_path = INPUT_DIR / VIDEO2_FILENAME
+    audio_path = INPUT_DIR / AUDIO_OVERLAY_FILENAME
+    logo_path = INPUT_DIR / LOGO_FILENAME
 
-    required_files = [video1_path, video2_path, audio_path, logo_path]
-    for f_path in required_files:
-        if not os.path.exists(f_path):
-            print(f"Error: Input file not found at '{f_path}'")
+    # One directory read instead of one stat() per required file
+    required_names = [VIDEO1_FILENAME, VIDEO2_FILENAME, AUDIO_OVERLAY_FILENAME, LOGO_FILENAME]
+    try:
+        present_names = {entry.name for entry in os.scandir(INPUT_DIR)}
+    except FileNotFoundError:
+        print(f"Error: Input directory not found at '{INPUT_DIR}'")
+        sys.exit(1)
+    for name in required_names:
+        if name not in present_names:
+            print(f"Error: Input file not found at '{INPUT_DIR / name}'")
             sys.exit(1)
 
     # 3. Create output directory
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    print(f"Output directory: '{os.path.abspath(OUTPUT_DIR)}'")
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Output directory: '{OUTPUT_DIR.resolve()}'")
 
     # 4. Define output file paths
-    qr_output_path = os.path.join(OUTPUT_DIR, QR_CODE_FILENAME)
-    intermediate1_output_path = os.path.join(OUTPUT_DIR, INTERMEDIATE_VIDEO1)
-    intermediate2_output_path = os.path.join(OUTPUT_DIR, INTERMEDIATE_VIDEO2)
-    final_output_path = os.path.join(OUTPUT_DIR, FINAL_OUTPUT_FILENAME)
+    qr_output_path = OUTPUT_DIR / QR_CODE_FILENAME
+    final_output_path = OUTPUT_DIR / FINAL_OUTPUT_FILENAME
 
     try:
         # --- Step 1: Generate QR code with Logo ---
@@ -62,38 +68,22 @@ def main():
             url=URL_TO_ENCODE,
             output_path=qr_output_path,
             logo_path=logo_path,
-            scale=10  # Increase scale for clearer QR code, easier logo embedding
+            scale=10,  # Increase scale for clearer QR code, easier logo embedding
+            target_size=QR_TARGET_SIZE  # Pre-scale to final size so FFmpeg never rescales
         )
 
-        # --- Step 2: Overlay QR code onto ch1.mp4 ---
-        print("\n--- Step 2: Overlaying QR Code onto Video 1 ---")
-        ffmpeg_utils.overlay_image(
+        # --- Step 2: Overlay QR code + target.m4a audio onto ch1.mp4 and append ch2.mp4, all in one pass ---
+        print("\n--- Step 2: Overlaying QR Code and Audio, then Appending Video 2 (single pass) ---")
+        ffmpeg_utils.overlay_image_and_audio(
             input_video_path=video1_path,
             image_path=qr_output_path,
-            output_video_path=intermediate1_output_path,
-            x=OVERLAY_X,
-            y=OVERLAY_Y
-        )
-
-        # --- Step 3: Overlay target.m4a audio onto previous result ---
-        print("\n--- Step 3: Overlaying Audio onto Intermediate Video 1 ---")
-        ffmpeg_utils.overlay_audio(
-            input_video_path=intermediate1_output_path,
             input_audio_path=audio_path,
-            output_video_path=intermediate2_output_path,
+            output_video_path=final_output_path,
+            x=OVERLAY_X,
+            y=OVERLAY_Y,
             volume_video=1.0,    # Keep original video volume
-            volume_overlay=0.8   # Slightly lower overlay audio volume
-        )
-
-        # --- Step 4: Concatenate processed video and ch2.mp4 ---
-        print("\n--- Step 4: Concatenating Videos ---")
-        videos_to_concat = [
-            os.path.abspath(intermediate2_output_path),  # Use absolute paths for reliability
-            os.path.abspath(video2_path)
-        ]
-        ffmpeg_utils.concatenate_videos(
-            video_paths=videos_to_concat,
-            output_video_path=final_output_path
+            volume_overlay=0.8,  # Slightly lower overlay audio volume
+            concat_video_paths=[video2_path]  # Appended via the concat filter, no intermediate file
         )
 
         print("\n--- Processing Complete! ---")
@@ -108,7 +98,7 @@ def main():
     finally:
         # Optional: Clean up intermediate files (if not needed)
         # print("\nCleaning up intermediate files...")
-        # files_to_remove = [qr_output_path, intermediate1_output_path, intermediate2_output_path]
+        # files_to_remove = [qr_output_path]
         # for f in files_to_remove:
         #     if os.path.exists(f):
         #         try: